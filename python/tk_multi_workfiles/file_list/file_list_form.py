@@ -12,8 +12,6 @@
 Custom widget that can display a list of work files/publishes in a couple of
 different views with options to show all versions or just the latest.
 """
-import weakref
-
 import sgtk
 from sgtk.platform.qt import QtCore, QtGui
 
@@ -21,7 +19,17 @@ from ..file_model import FileModel
 from ..ui.file_list_form import Ui_FileListForm
 from .file_proxy_model import FileProxyModel
 from .file_list_item_delegate import FileListItemDelegate
-from ..util import get_model_data, map_to_source, get_source_model
+from ..util import get_model_data, get_model_data_multi
+
+# The FileModel roles and node types used by the selection, double-click and
+# context menu callbacks are bound as module-level constants to avoid the
+# repeated attribute lookups in these frequently called slots:
+_FILE_ITEM_ROLE = FileModel.FILE_ITEM_ROLE
+_WORK_AREA_ROLE = FileModel.WORK_AREA_ROLE
+_NODE_TYPE_ROLE = FileModel.NODE_TYPE_ROLE
+_ITEM_PTR_ROLE = FileModel.ITEM_PTR_ROLE
+_FILE_NODE_TYPE = FileModel.FILE_NODE_TYPE
+_FOLDER_NODE_TYPE = FileModel.FOLDER_NODE_TYPE
 
 
 class FileListForm(QtGui.QWidget):
@@ -47,6 +55,10 @@ class FileListForm(QtGui.QWidget):
         object, object, QtCore.QPoint
     )  # file, env, pos
 
+    # interval used to coalesce bursts of search keystrokes into a single
+    # filter update on the proxy model:
+    _SEARCH_UPDATE_DELAY_MS = 150
+
     def __init__(
         self,
         parent,
@@ -67,8 +79,49 @@ class FileListForm(QtGui.QWidget):
 
         # keep track of the file to select when/if it appears in the attached model
         self._file_to_select = None
-        # and keep track of the currently selected item
-        self._current_item_ref = None
+        # and keep track of the currently selected item via a persistent index
+        # into the source model.  A persistent index tracks moves and sorts
+        # natively so the item can be re-resolved in O(1) without a lookup:
+        self._current_item_pidx = None
+
+        # row path of the item the last file_selected signal was emitted for.
+        # This is used to suppress duplicate emissions when the selection
+        # didn't semantically change:
+        self._last_emitted_item_key = None
+
+        # flag used to coalesce bursts of rowsInserted signals from the filter
+        # model into a single deferred selection update:
+        self._pending_selection_update = False
+
+        # set when rows arrive whilst the form is hidden.  The selection update
+        # is deferred until the form is next shown as the view can't display
+        # anything in the meantime:
+        self._pending_reselect = False
+
+        # True whilst the model is bulk-loading and dynamic sorting on the
+        # filter model is suspended:
+        self._in_bulk_load = False
+
+        # cache of the last source-to-proxy index mapping as a
+        # (source persistent index, proxy index) tuple.  The cache is cleared
+        # whenever the filter model restructures as the proxy index is only
+        # valid until then:
+        self._map_from_source_cache = None
+
+        # cached handles to the models used by the view.  These are set in
+        # set_model and avoid repeatedly re-fetching the selection model and
+        # source model in the various selection slots:
+        self._filter_model = None
+        self._source_model = None
+        self._selection_model = None
+
+        # timer used to debounce search text changes so that the filter is only
+        # updated once for a burst of keystrokes rather than for every single one:
+        self._pending_search_text = None
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(FileListForm._SEARCH_UPDATE_DELAY_MS)
+        self._search_timer.timeout.connect(self._apply_search)
 
         self._file_filters = file_filters
         if self._file_filters:
@@ -102,8 +155,13 @@ class FileListForm(QtGui.QWidget):
             QtGui.QAbstractItemView.SingleSelection
         )
         self._ui.file_list_view.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        # the view is captured in the lambda rather than relying on sender() in
+        # the slot - only one view is ever connected and this avoids Qt's
+        # sender-tracking lookup on every right-click:
         self._ui.file_list_view.customContextMenuRequested.connect(
-            self._on_context_menu_requested
+            lambda pnt, v=self._ui.file_list_view: self._on_context_menu_requested(
+                v, pnt
+            )
         )
 
         # we want to handle double-click on items but we only want double-clicks to work when using
@@ -112,24 +170,70 @@ class FileListForm(QtGui.QWidget):
         self._ui.file_list_view.doubleClicked.connect(self._on_item_double_clicked)
         self._ui.file_list_view.viewport().installEventFilter(self)
 
+        # the item delegate for the list view is created lazily - building it is
+        # not free and this form may never be shown (e.g. a tab the user never
+        # flips to):
+        self._item_delegate = None
+
+    def _ensure_item_delegate(self):
+        """
+        Create the item delegate for the list view if it hasn't been created yet.
+        """
+        if self._item_delegate:
+            return
         # Note, we have to keep a handle to the item delegate to help GC
         self._item_delegate = FileListItemDelegate(self._ui.file_list_view)
         self._ui.file_list_view.setItemDelegate(self._item_delegate)
 
+    def showEvent(self, event):
+        """
+        Overriden from base class - triggered when the widget is shown.
+
+        :param event:   The QShowEvent for this event
+        """
+        # make sure the list view has its delegate before anything is painted:
+        self._ensure_item_delegate()
+
+        # flush any selection update that was deferred whilst the form was
+        # hidden:
+        if self._pending_reselect:
+            self._pending_reselect = False
+            if not self._pending_selection_update:
+                self._pending_selection_update = True
+                QtCore.QTimer.singleShot(0, self._flush_selection_update)
+
+        QtGui.QWidget.showEvent(self, event)
+
     def shut_down(self):
         """
         Clean up as much as we can to help the gc once the widget is finished with.
         """
         signals_blocked = self.blockSignals(True)
         try:
+            # stop any pending search update:
+            self._search_timer.stop()
+            self._pending_search_text = None
+
+            # and cancel any pending selection update:
+            self._pending_selection_update = False
+            self._pending_reselect = False
+
+            # make sure the view isn't left with updates disabled if we were
+            # shut down part way through a bulk load:
+            if self._in_bulk_load:
+                self._in_bulk_load = False
+                self._ui.file_list_view.setUpdatesEnabled(True)
+
             # clear any references:
             self._file_to_select = None
-            self._current_item_ref = None
+            self._current_item_pidx = None
+            self._last_emitted_item_key = None
             self._file_filters = None
 
             # clear the selection:
-            if self._ui.file_list_view.selectionModel():
-                self._ui.file_list_view.selectionModel().clear()
+            if self._selection_model:
+                self._selection_model.clear()
+                self._selection_model = None
 
             # detach the filter model from the views.  Note, this code assumes the same filter view
             # has been applied to both the list and the details view - if this isn't the case then
@@ -143,6 +247,9 @@ class FileListForm(QtGui.QWidget):
                 if isinstance(view_model, FileProxyModel):
                     view_model.setSourceModel(None)
                     view_model = None
+            self._filter_model = None
+            self._source_model = None
+            self._map_from_source_cache = None
 
             # detach and clean up the item delegate:
             self._ui.file_list_view.setItemDelegate(None)
@@ -184,15 +291,15 @@ class FileListForm(QtGui.QWidget):
         selected_file = None
         env_details = None
 
-        selection_model = self._ui.file_list_view.selectionModel()
-        if selection_model:
-            selected_indexes = selection_model.selectedIndexes()
-            if len(selected_indexes) == 1:
-                selected_file = get_model_data(
-                    selected_indexes[0], FileModel.FILE_ITEM_ROLE
-                )
-                env_details = get_model_data(
-                    selected_indexes[0], FileModel.WORK_AREA_ROLE
+        if self._selection_model and self._selection_model.hasSelection():
+            # the view only ever allows a single selection so the current index
+            # is the selected index - this avoids building a list of selected
+            # indexes just to pull out the only entry:
+            selected_index = self._selection_model.currentIndex()
+            if selected_index.isValid():
+                selected_file, env_details = get_model_data_multi(
+                    selected_index,
+                    (_FILE_ITEM_ROLE, _WORK_AREA_ROLE),
                 )
 
         return (selected_file, env_details)
@@ -252,45 +359,103 @@ class FileListForm(QtGui.QWidget):
 
         # update the internal tracking info:
         self._file_to_select = (file_item, context)
-        self._current_item_ref = None
+        self._current_item_pidx = None
 
         # update the selection - this will emit a file_selected signal if
         # the selection is changed as a result of the overall call to select_file
         self._update_selection(prev_selected_item)
 
+    def begin_bulk_load(self):
+        """
+        Suspend dynamic sorting/filtering and view updates whilst the model is
+        being bulk-loaded.  This avoids the filter model re-sorting and the view
+        re-laying itself out for every batch of rows that gets inserted.
+        """
+        if self._in_bulk_load:
+            return
+        self._in_bulk_load = True
+
+        if self._filter_model:
+            self._filter_model.setDynamicSortFilter(False)
+        self._ui.file_list_view.setUpdatesEnabled(False)
+
+    def end_bulk_load(self):
+        """
+        Re-enable dynamic sorting/filtering and view updates once the model has
+        finished bulk-loading, re-sorting the filter model once for the entire
+        load.
+        """
+        if not self._in_bulk_load:
+            return
+        self._in_bulk_load = False
+
+        if self._filter_model:
+            # sort once for everything that was loaded:
+            self._filter_model.sort(0, QtCore.Qt.DescendingOrder)
+            self._filter_model.setDynamicSortFilter(True)
+        self._ui.file_list_view.setUpdatesEnabled(True)
+
     def set_model(self, model):
         """
         Set the current file model for the control
 
         :param model:    The FileModel model to attach to the control to
         """
-        if True:
-            # create a filter model around the source model:
-            filter_model = FileProxyModel(
-                self,
-                filters=self._file_filters,
-                show_work_files=self._show_work_files,
-                show_publishes=self._show_publishes,
-            )
-            filter_model.rowsInserted.connect(self._on_filter_model_rows_inserted)
-            filter_model.setSourceModel(model)
-
-            # set automatic sorting on the model:
-            filter_model.sort(0, QtCore.Qt.DescendingOrder)
-            filter_model.setDynamicSortFilter(True)
-
-            # connect the views to the filtered model:
-            self._ui.file_list_view.setModel(filter_model)
-            self._ui.file_details_view.setModel(filter_model)
-        else:
-            # connect the views to the model:
-            self._ui.file_list_view.setModel(model)
-            self._ui.file_details_view.setModel(model)
+        # if the form is already visible then the list view needs its delegate
+        # before the model data arrives:
+        if self.isVisible():
+            self._ensure_item_delegate()
+
+        # create a filter model around the source model:
+        filter_model = FileProxyModel(
+            self,
+            filters=self._file_filters,
+            show_work_files=self._show_work_files,
+            show_publishes=self._show_publishes,
+        )
+        # use a queued connection so that the slot runs from the event loop
+        # rather than re-entering Python synchronously for every batch of rows
+        # inserted during a filter/sort rebuild:
+        filter_model.rowsInserted.connect(
+            self._on_filter_model_rows_inserted, QtCore.Qt.QueuedConnection
+        )
 
-        # connect to the selection model:
-        selection_model = self._ui.file_list_view.selectionModel()
-        if selection_model:
-            selection_model.selectionChanged.connect(self._on_selection_changed)
+        # any restructuring of the filter model invalidates the cached
+        # source-to-proxy index mapping:
+        filter_model.rowsInserted.connect(self._invalidate_index_caches)
+        filter_model.rowsRemoved.connect(self._invalidate_index_caches)
+        filter_model.layoutChanged.connect(self._invalidate_index_caches)
+        filter_model.modelReset.connect(self._invalidate_index_caches)
+
+        filter_model.setSourceModel(model)
+
+        # set automatic sorting on the model:
+        filter_model.sort(0, QtCore.Qt.DescendingOrder)
+        filter_model.setDynamicSortFilter(True)
+
+        # connect the views to the filtered model:
+        self._ui.file_list_view.setModel(filter_model)
+        self._ui.file_details_view.setModel(filter_model)
+
+        self._filter_model = filter_model
+
+        # cache the source model so that the selection slots don't have to walk
+        # the proxy chain each time they need it:
+        self._source_model = model
+
+        # suspend dynamic sorting whilst the model is loading so that the
+        # filter model only gets sorted once per load:
+        model.searches_started.connect(self.begin_bulk_load)
+        model.searches_finished.connect(self.end_bulk_load)
+
+        # connect to the selection model.  A queued connection is used so that
+        # a burst of selection deltas is processed from the event loop instead
+        # of synchronously re-entering Python for each one:
+        self._selection_model = self._ui.file_list_view.selectionModel()
+        if self._selection_model:
+            self._selection_model.selectionChanged.connect(
+                self._on_selection_changed, QtCore.Qt.QueuedConnection
+            )
 
     # ------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------
@@ -317,7 +482,7 @@ class FileListForm(QtGui.QWidget):
         # we ignore all other events
         return False
 
-    def _update_selection(self, prev_selected_item=None):
+    def _update_selection(self, prev_selected_item=None, need_scroll=True):
         """
         Update the selection to either the to-be-selected file if set or the current item if known.  The
         current item is the item that was last selected but which may no longer be visible in the view due
@@ -327,58 +492,97 @@ class FileListForm(QtGui.QWidget):
         :param prev_selected_item:  The item that was previously selected (if any).  If, at the end of this
                                     method the selection is different then a file_selected signal will be
                                     emitted
-        """
+        :param need_scroll:         If True then the view will be scrolled to make the selected item
+                                    visible.  Pass False when updating the selection for streamed row
+                                    inserts where scrolling would force a re-layout for every batch.
+        """
+        if self._file_to_select is None and (
+            self._current_item_pidx is None or not self._current_item_pidx.isValid()
+        ):
+            # there is nothing to select or restore so there is no need to run
+            # the mapping/scrolling machinery below:
+            return
+
         # we want to make sure we don't emit any signals whilst we are
         # manipulating the selection:
         signals_blocked = self.blockSignals(True)
         try:
-            # try to get the item to select:
-            item = None
-            if self._file_to_select:
+            # try to get the source index of the item to select:
+            src_idx = None
+            if self._file_to_select and self._source_model:
                 # we know about a file we should try to select:
-                src_model = get_source_model(self._ui.file_list_view.model())
                 file_item, _ = self._file_to_select
-                items = src_model.items_from_file(file_item)
-                item = items[0] if items else None
-            elif self._current_item_ref:
-                # no item to select but we do know about a current item:
-                item = self._current_item_ref()
-
-            if item:
-                idx = item.index()
-                if isinstance(
-                    self._ui.file_list_view.model(), QtGui.QAbstractProxyModel
-                ):
-                    idx = self._ui.file_list_view.model().mapFromSource(idx)
-                if idx.isValid():
-                    # make sure the item is expanded and visible in the list:
-                    self._ui.file_list_view.scrollTo(idx)
-
-                    # select the item:
+                items = self._source_model.items_from_file(file_item)
+                if items:
+                    src_idx = items[0].index()
+            elif self._current_item_pidx and self._current_item_pidx.isValid():
+                # no item to select but we do know about a current item so
+                # resolve its persistent index - no item lookup is needed:
+                pidx = self._current_item_pidx
+                src_idx = self._source_model.index(
+                    pidx.row(), pidx.column(), pidx.parent()
+                )
+
+            if src_idx is not None and src_idx.isValid():
+                idx = src_idx
+                if self._filter_model:
+                    idx = self._map_from_source(idx)
+                if idx.isValid() and self._selection_model:
+                    if need_scroll:
+                        # make sure the item is expanded and visible in the list:
+                        self._ui.file_list_view.scrollTo(
+                            idx, QtGui.QAbstractItemView.EnsureVisible
+                        )
+
+                    # select the item.  Note, signals are blocked on the
+                    # selection model itself as blocking them on the widget
+                    # doesn't stop the selectionChanged slot from running:
                     selection_flags = (
                         QtGui.QItemSelectionModel.Clear
                         | QtGui.QItemSelectionModel.SelectCurrent
                     )
-                    self._ui.file_list_view.selectionModel().select(
-                        idx, selection_flags
+                    # record the item we're about to select before selecting it
+                    # so that the selection-changed slot no-ops instead of
+                    # re-emitting for the same item.  Note, the selection
+                    # model's signals are deliberately left unblocked as the
+                    # view relies on them to update the highlighted item.
+                    # Select via setCurrentIndex so that the current index
+                    # tracks the selection - the selected-item readers use
+                    # currentIndex() which select() alone doesn't update:
+                    self._last_emitted_item_key = self._item_row_path(
+                        self._source_model.itemFromIndex(src_idx)
                     )
+                    self._selection_model.setCurrentIndex(idx, selection_flags)
+
+                    # the selection-changed slot will no-op for this select so
+                    # do its bookkeeping here: track the item that was just
+                    # selected and clear the file-to-select now that it has
+                    # been found:
+                    self._current_item_pidx = QtCore.QPersistentModelIndex(src_idx)
+                    self._file_to_select = None
         finally:
             self.blockSignals(signals_blocked)
 
             # if the selection is different to the previously selected item then we
-            # will emit a file_selected signal:
+            # will emit a file_selected signal.  Note, the items are compared by
+            # their row path in the model rather than by id() as an id is only
+            # unique for the lifetime of the object and can be re-used for a new
+            # item if the previous one has been garbage collected:
             selected_item = self._get_selected_item()
-            if id(selected_item) != id(prev_selected_item):
+            selected_item_key = self._item_row_path(selected_item)
+            if selected_item_key != self._item_row_path(prev_selected_item):
+                # keep track of the item we're about to emit for so that
+                # duplicate emissions can be suppressed:
+                self._last_emitted_item_key = selected_item_key
+
                 # emit a selection changed signal:
                 selected_file = None
                 env_details = None
                 if selected_item:
-                    # extract the file item from the index:
-                    selected_file = get_model_data(
-                        selected_item, FileModel.FILE_ITEM_ROLE
-                    )
-                    env_details = get_model_data(
-                        selected_item, FileModel.WORK_AREA_ROLE
+                    # extract the file item and work area from the index:
+                    selected_file, env_details = get_model_data_multi(
+                        selected_item,
+                        (_FILE_ITEM_ROLE, _WORK_AREA_ROLE),
                     )
 
                 # emit the signal
@@ -386,6 +590,59 @@ class FileListForm(QtGui.QWidget):
                     selected_file, env_details, FileListForm.SYSTEM_SELECTED
                 )
 
+    def _item_row_path(self, item):
+        """
+        Build a stable key for the specified model item from its row and the rows
+        of all its parents up to the root of the model.  Two different items in
+        the same model can never share a row path, making this a safe way to
+        compare items for equality.
+
+        :param item:    The QStandardItem to build the key for.  Can be None.
+        :returns:       A tuple of rows from the root of the model down to the
+                        item, or None if no item was specified
+        """
+        if item is None:
+            return None
+        path = []
+        while item:
+            path.append(item.row())
+            item = item.parent()
+        path.reverse()
+        return tuple(path)
+
+    def _map_from_source(self, src_idx):
+        """
+        Map the specified source model index to the filter model, re-using the
+        previous result if the same index is mapped again before the filter
+        model restructures.  mapFromSource isn't cheap on a sort/filter proxy
+        model and this gets called repeatedly with the same index whilst
+        restoring the selection.
+
+        :param src_idx: The source model QModelIndex to map
+        :returns:       The corresponding QModelIndex in the filter model
+        """
+        cached = self._map_from_source_cache
+        if cached and cached[0].isValid() and cached[0] == src_idx:
+            return cached[1]
+
+        proxy_idx = self._filter_model.mapFromSource(src_idx)
+        self._map_from_source_cache = (
+            QtCore.QPersistentModelIndex(src_idx),
+            proxy_idx,
+        )
+        return proxy_idx
+
+    def _invalidate_index_caches(self, *args):
+        """
+        Slot triggered when the filter model restructures in any way.  Both the
+        cached source-to-proxy index mapping and the last-emitted item key are
+        invalidated - row paths are only comparable for as long as no rows have
+        moved, so once rows have been inserted or removed the next selection
+        must always be emitted even if its row path happens to match.
+        """
+        self._map_from_source_cache = None
+        self._last_emitted_item_key = None
+
     def _on_file_filters_changed(self):
         """
         Slot triggered whenever the file filters emits the changed signal.
@@ -409,29 +666,29 @@ class FileListForm(QtGui.QWidget):
         # update user filter button
         self._ui.user_filter_btn.available_users = users
 
-    def _on_context_menu_requested(self, pnt):
+    def _on_context_menu_requested(self, view, pnt):
         """
         Slot triggered when a context menu has been requested from one of the file views.  This
         will collect information about the item under the cursor and emit a file_context_menu_requested
         signal.
 
-        :param pnt: The position for the context menu relative to the source widget
+        :param view:    The view the context menu was requested from
+        :param pnt:     The position for the context menu relative to the source widget
         """
         # get the item under the point:
-        idx = self._ui.file_list_view.indexAt(pnt)
+        idx = view.indexAt(pnt)
         if not idx or not idx.isValid():
             return
 
-        # get the file from the index:
-        file_item = get_model_data(idx, FileModel.FILE_ITEM_ROLE)
+        # get the file and the env details from the index:
+        file_item, env_details = get_model_data_multi(
+            idx, (_FILE_ITEM_ROLE, _WORK_AREA_ROLE)
+        )
         if not file_item:
             return
 
-        # ...and the env details:
-        env_details = get_model_data(idx, FileModel.WORK_AREA_ROLE)
-
         # remap the point from the source widget:
-        pnt = self.sender().mapTo(self, pnt)
+        pnt = view.mapTo(self, pnt)
 
         # emit a more specific signal:
         self.file_context_menu_requested.emit(file_item, env_details, pnt)
@@ -443,12 +700,13 @@ class FileListForm(QtGui.QWidget):
         :returns:   The currently selected model item if any
         """
         item = None
-        selection_model = self._ui.file_list_view.selectionModel()
-        if selection_model:
-            indexes = selection_model.selectedIndexes()
-            if len(indexes) == 1:
-                src_idx = map_to_source(indexes[0])
-                item = src_idx.model().itemFromIndex(src_idx)
+        if self._selection_model and self._selection_model.hasSelection():
+            # single-selection view so the current index is the selected index.
+            # Note, the item is read directly off the index via the item-ptr
+            # role which avoids mapping the index back to the source model:
+            idx = self._selection_model.currentIndex()
+            if idx.isValid():
+                item = get_model_data(idx, _ITEM_PTR_ROLE)
         return item
 
     def _reset_selection(self):
@@ -458,46 +716,118 @@ class FileListForm(QtGui.QWidget):
 
         :returns:   The selected item before the selection was reset if any
         """
-        selection_model = self._ui.file_list_view.selectionModel()
-        if not selection_model:
+        if not self._selection_model:
             return None
 
         prev_selected_item = self._get_selected_item()
         # reset the current selection without emitting any signals:
-        selection_model.reset()
+        self._selection_model.reset()
+
+        # the selection no longer exists so the next selection should always
+        # be emitted, whatever it is:
+        self._last_emitted_item_key = None
 
         return prev_selected_item
 
+    def _reset_and_reselect(self, apply_fn):
+        """
+        Reset the current selection, run the specified callable to change the
+        filtering and then update the selection once to restore the original
+        selection if it is still visible.  Fusing the reset and the restore
+        means the previously selected item is only resolved and mapped once
+        for the whole operation.
+
+        :param apply_fn:    A callable that applies the filter change.  Any
+                            exception it raises is propagated but the selection
+                            is always updated.
+        """
+        # reset the current selection and get the previously selected item:
+        prev_selected_item = self._reset_selection()
+        try:
+            apply_fn()
+        finally:
+            # and update the selection - this will restore the original selection if possible.
+            self._update_selection(prev_selected_item)
+
     def _on_filter_model_rows_inserted(self, parent, first, last):
         """
         Slot triggered when new rows are inserted into the filter model.  This allows us
         to update the selection if a new row matches the task-to-select.
 
+        Note, during an asynchronous model load this signal is emitted once for every
+        contiguous batch of rows that gets inserted.  Rather than re-evaluating the
+        selection for each batch, a single deferred update is scheduled so that the
+        selection is only updated once for the entire burst.
+
         :param parent_idx:  The parent model index of the rows that were inserted
         :param first:       The first row id inserted
         :param last:        The last row id inserted
         """
-        # try to select the current file from the new items in the model:
+        if self._file_to_select is None:
+            # no file is waiting to be selected so the new rows are of no
+            # interest to the selection logic:
+            return
+        if not self.isVisible():
+            # the view can't display anything whilst the form is hidden so
+            # defer the selection update until it is next shown.  The
+            # file-to-select/current-item state is kept so nothing is lost:
+            self._pending_reselect = True
+            return
+        if self._pending_selection_update:
+            # an update is already scheduled:
+            return
+        self._pending_selection_update = True
+        QtCore.QTimer.singleShot(0, self._flush_selection_update)
+
+    def _flush_selection_update(self):
+        """
+        Perform the deferred selection update scheduled by _on_filter_model_rows_inserted.
+        """
+        if not self._pending_selection_update:
+            return
+        self._pending_selection_update = False
+
+        # try to select the current file from the new items in the model.  Note,
+        # we don't scroll here as doing so would force a re-layout for every
+        # batch of rows streamed into the model:
         prev_selected_item = self._get_selected_item()
-        self._update_selection(prev_selected_item)
+        self._update_selection(prev_selected_item, need_scroll=False)
 
     def _on_search_changed(self, search_text):
         """
-        Slot triggered when the search text has been changed.
+        Slot triggered when the search text has been changed.  Rather than updating
+        the filter immediately, the new text is recorded and the debounce timer
+        (re-)started so that a burst of keystrokes only results in a single filter
+        update on the proxy model.
 
         :param search_text: The new search text
         """
-        # reset the current selection and get the previously selected item:
-        prev_selected_item = self._reset_selection()
-        try:
-            # update the proxy filter search text:
-            filter_reg_exp = QtCore.QRegExp(
-                search_text, QtCore.Qt.CaseInsensitive, QtCore.QRegExp.FixedString
-            )
+        # Note, the text is recorded as-is - the minimum-character rule is
+        # applied by the proxy model when the filter is consumed so that the
+        # text the user typed survives the round-trip through the shared
+        # FileFilters state and back into the search control:
+        self._pending_search_text = search_text
+        self._search_timer.start()
+
+    def _apply_search(self):
+        """
+        Apply the most recently entered search text to the proxy model.  This is
+        called from the debounce timer once the search text has settled.
+        """
+        search_text = self._pending_search_text
+        if search_text is None:
+            return
+        self._pending_search_text = None
+
+        # build the new proxy filter search text:
+        filter_reg_exp = QtCore.QRegExp(
+            search_text, QtCore.Qt.CaseInsensitive, QtCore.QRegExp.FixedString
+        )
+
+        def apply_fn():
             self._file_filters.filter_reg_exp = filter_reg_exp
-        finally:
-            # and update the selection - this will restore the original selection if possible.
-            self._update_selection(prev_selected_item)
+
+        self._reset_and_reselect(apply_fn)
 
     def _on_show_all_versions_toggled(self, checked):
         """
@@ -505,14 +835,11 @@ class FileListForm(QtGui.QWidget):
 
         :param checked: True if the checkbox has been checked, otherwise False
         """
-        # reset the current selection and get the previously selected item:
-        prev_selected_item = self._reset_selection()
-        try:
-            # update the filter model:
+
+        def apply_fn():
             self._file_filters.show_all_versions = checked
-        finally:
-            # and update the selection - this will restore the original selection if possible.
-            self._update_selection(prev_selected_item)
+
+        self._reset_and_reselect(apply_fn)
 
     def _on_user_filter_btn_users_selected(self, users):
         """
@@ -520,14 +847,11 @@ class FileListForm(QtGui.QWidget):
 
         :param users:   The new list of selected users
         """
-        # reset the current selection and get the previously selected item:
-        prev_selected_item = self._reset_selection()
-        try:
-            # update the filter model:
+
+        def apply_fn():
             self._file_filters.users = users
-        finally:
-            # and update the selection - this will restore the original selection if possible.
-            self._update_selection(prev_selected_item)
+
+        self._reset_and_reselect(apply_fn)
 
     def _on_item_double_clicked(self, idx):
         """
@@ -536,15 +860,16 @@ class FileListForm(QtGui.QWidget):
 
         :param idx:    The model index of the item that was double-clicked
         """
-        item_type = get_model_data(idx, FileModel.NODE_TYPE_ROLE)
-        if item_type == FileModel.FOLDER_NODE_TYPE:
+        item_type = get_model_data(idx, _NODE_TYPE_ROLE)
+        if item_type == _FOLDER_NODE_TYPE:
             # selection is a folder/child so move into it
             # TODO
             pass
-        elif item_type == FileModel.FILE_NODE_TYPE:
+        elif item_type == _FILE_NODE_TYPE:
             # this is a file so perform the default action for the file
-            selected_file = get_model_data(idx, FileModel.FILE_ITEM_ROLE)
-            env_details = get_model_data(idx, FileModel.WORK_AREA_ROLE)
+            selected_file, env_details = get_model_data_multi(
+                idx, (_FILE_ITEM_ROLE, _WORK_AREA_ROLE)
+            )
             self.file_double_clicked.emit(selected_file, env_details)
 
     def _on_selection_changed(self, selected, deselected):
@@ -555,24 +880,43 @@ class FileListForm(QtGui.QWidget):
         :param deselected:  QItemSelection containing any newly deselected indexes
         """
         # get the item that was selected:
-        item = None
         selected_indexes = selected.indexes()
+        if not selected_indexes:
+            # the current item was deselected (e.g. by ctrl-clicking it)
+            # without a new item being selected - clear the tracked item and
+            # let any interested parties know that nothing is selected now:
+            self._current_item_pidx = None
+            self._last_emitted_item_key = None
+            self.file_selected.emit(None, None, FileListForm.USER_SELECTED)
+            return
+
+        item = None
         if len(selected_indexes) == 1:
-            # extract the selected model index from the selection:
-            selected_index = map_to_source(selected_indexes[0])
-            if selected_index and selected_index.isValid():
-                item = selected_index.model().itemFromIndex(selected_index)
+            # extract the selected model item directly from the selection via
+            # the item-ptr role - this avoids mapping the index back to the
+            # source model:
+            item = get_model_data(selected_indexes[0], _ITEM_PTR_ROLE)
+
+        # if the selection didn't semantically change then there is no need to
+        # re-emit the file_selected signal and trigger the downstream UI:
+        item_key = self._item_row_path(item)
+        if item_key == self._last_emitted_item_key:
+            return
+        self._last_emitted_item_key = item_key
 
         # get the file and env details for this item:
         selected_file = None
         env_details = None
         if item:
-            # extract the file item from the index:
-            selected_file = get_model_data(item, FileModel.FILE_ITEM_ROLE)
-            env_details = get_model_data(item, FileModel.WORK_AREA_ROLE)
+            # extract the file item and work area from the index:
+            selected_file, env_details = get_model_data_multi(
+                item, (_FILE_ITEM_ROLE, _WORK_AREA_ROLE)
+            )
 
-        self._current_item_ref = weakref.ref(item) if item else None
-        if self._current_item_ref:
+        self._current_item_pidx = (
+            QtCore.QPersistentModelIndex(item.index()) if item else None
+        )
+        if self._current_item_pidx:
             # clear the file-to-select as the current item now takes precedence
             self._file_to_select = None
 
@@ -13,9 +13,8 @@ import sgtk
 from sgtk.platform.qt import QtCore
 from tank_vendor import six
 
-from ..file_model import FileModel
 from ..framework_qtwidgets import HierarchicalFilteringProxyModel
-from ..util import get_model_data, get_model_str
+from ..util import value_to_str
 
 
 class FileProxyModel(HierarchicalFilteringProxyModel):
@@ -47,6 +46,17 @@ class FileProxyModel(HierarchicalFilteringProxyModel):
         self._show_publishes = show_publishes
         self._show_workfiles = show_work_files
 
+        # the lower-case search text when the filter regex is a fixed string,
+        # otherwise None.  This allows the row filtering to use a plain
+        # substring match instead of running the regex engine for every row:
+        self._filter_text = ""
+        self._update_filter_text()
+
+        # the set of user sandbox ids to filter by.  This is rebuilt whenever
+        # the filters change rather than for every row that gets filtered:
+        self._filter_user_ids = set()
+        self._update_filter_user_ids()
+
     # @property
     def _get_show_publishes(self):
         return self._show_publishes
@@ -90,8 +100,39 @@ class FileProxyModel(HierarchicalFilteringProxyModel):
             HierarchicalFilteringProxyModel.setFilterRegExp(
                 self, self._filters.filter_reg_exp
             )
+        self._update_filter_text()
+        self._update_filter_user_ids()
         self.invalidateFilter()
 
+    def _update_filter_user_ids(self):
+        """
+        Update the cached set of user ids from the current filter settings.  The
+        per-row filtering just tests membership of this set rather than
+        rebuilding it for every row in the source model.
+        """
+        if self._filters:
+            self._filter_user_ids = set(u["id"] for u in self._filters.users if u)
+        else:
+            self._filter_user_ids = set()
+
+    def _update_filter_text(self):
+        """
+        Update the cached plain search text from the current filter regex.  If the
+        regex isn't a simple fixed-string pattern then the cached text is set to
+        None and filtering falls back to the regex engine.
+        """
+        reg_exp = self._filters.filter_reg_exp if self._filters else None
+        if reg_exp is None or reg_exp.patternSyntax() == QtCore.QRegExp.FixedString:
+            self._filter_text = (
+                value_to_str(reg_exp.pattern()).lower() if reg_exp else ""
+            )
+            if len(self._filter_text) == 1:
+                # a single character isn't worth filtering on - treat it as an
+                # empty filter until more text has been typed:
+                self._filter_text = ""
+        else:
+            self._filter_text = None
+
     def _is_row_accepted(self, src_row, src_parent_idx, parent_accepted):
         """
         Overriden from base class - determines if the specified row should be accepted or not by
@@ -102,45 +143,72 @@ class FileProxyModel(HierarchicalFilteringProxyModel):
         :param parent_accepted: True if a parent item has been accepted by the filter
         :returns:               True if this index should be accepted, otherwise False
         """
-        src_idx = self.sourceModel().index(src_row, 0, src_parent_idx)
+        src_model = self.sourceModel()
+        src_idx = src_model.index(src_row, 0, src_parent_idx)
         if not src_idx.isValid():
             return False
 
+        # get the item for the index and read the file and work area details
+        # directly off it.  This method gets called for every row in the source
+        # model whenever the filter changes so we want to avoid dispatching
+        # through the model's data() method for each role we need:
+        src_item = src_model.itemFromIndex(src_idx)
+
         # try to get the work area and see if this item should be filtered:
-        work_area = get_model_data(src_idx, FileModel.WORK_AREA_ROLE)
+        work_area = getattr(src_item, "work_area", None)
         if work_area and work_area.context and work_area.context.user:
-            user_ids = set(u["id"] for u in self._filters.users if u)
-            if work_area.context.user["id"] not in user_ids:
+            if work_area.context.user["id"] not in self._filter_user_ids:
                 return False
 
         # get the file item and see if it should be filtered:
-        file_item = get_model_data(src_idx, FileModel.FILE_ITEM_ROLE)
+        file_item = getattr(src_item, "file_item", None)
         if file_item:
+            # bind the visibility flags as locals - this method is the hottest
+            # Python callback when filtering so every attribute lookup counts:
+            show_workfiles = self._show_workfiles
+            show_publishes = self._show_publishes
+
             ## Filter based on showing work files, publishes or both:
-            if not (file_item.is_local and self._show_workfiles) and not (
-                file_item.is_published and self._show_publishes
+            if not (file_item.is_local and show_workfiles) and not (
+                file_item.is_published and show_publishes
             ):
                 return False
 
             if not self._filters.show_all_versions:
-                # Filter based on latest version - need to check if this is the latest
-                # version of the file:
-                all_versions = file_item.versions
-
-                visible_versions = [
-                    v
-                    for v, f in six.iteritems(all_versions)
-                    if (f.is_local and self._show_workfiles)
-                    or (f.is_published and self._show_publishes)
-                ]
-
-                if not visible_versions or file_item.version != max(visible_versions):
+                # Filter based on latest version - need to check if this is the
+                # latest visible version of the file.  The maximum is tracked
+                # in a single pass rather than building an intermediate list:
+                max_visible_version = None
+                for v, f in six.iteritems(file_item.versions):
+                    if (f.is_local and show_workfiles) or (
+                        f.is_published and show_publishes
+                    ):
+                        if max_visible_version is None or v > max_visible_version:
+                            max_visible_version = v
+
+                if (
+                    max_visible_version is None
+                    or file_item.version != max_visible_version
+                ):
                     return False
 
         # now compare text for item:
         if parent_accepted:
             return True
 
+        filter_text = self._filter_text
+        if filter_text is not None:
+            # the filter is a fixed string so use a plain case-insensitive
+            # substring match rather than running the regex engine per row:
+            if not filter_text:
+                # early out
+                return True
+            if file_item:
+                return filter_text in file_item.name.lower()
+            # item text is read via value_to_str as it can be a QString when
+            # running under PyQt:
+            return filter_text in value_to_str(src_item.text()).lower()
+
         reg_exp = self.filterRegExp()
         if reg_exp.isEmpty():
             # early out
@@ -151,7 +219,7 @@ class FileProxyModel(HierarchicalFilteringProxyModel):
             if reg_exp.indexIn(file_item.name) != -1:
                 return True
         else:
-            if reg_exp.indexIn(get_model_str(src_idx)) != -1:
+            if reg_exp.indexIn(value_to_str(src_item.text())) != -1:
                 return True
 
         # default is to not match:
@@ -176,17 +244,23 @@ class FileProxyModel(HierarchicalFilteringProxyModel):
             else:
                 return right_src_idx.row() < left_src_idx.row()
 
-        # get the items:
-        left_item = get_model_data(left_src_idx, FileModel.FILE_ITEM_ROLE)
-        right_item = get_model_data(right_src_idx, FileModel.FILE_ITEM_ROLE)
+        # get the items directly from the source model and read the file items
+        # off them - this avoids dispatching through data() for each index which
+        # is expensive when the model is being sorted:
+        src_model = left_src_idx.model()
+        left_src_item = src_model.itemFromIndex(left_src_idx)
+        right_src_item = src_model.itemFromIndex(right_src_idx)
+        left_item = getattr(left_src_item, "file_item", None)
+        right_item = getattr(right_src_item, "file_item", None)
 
         # handle the case where one or both items are not file items:
         if not left_item:
             if not right_item:
-                # sort in alphabetical order:
+                # sort in alphabetical order.  Note, the item text is read via
+                # value_to_str as it can be a QString when running under PyQt:
                 is_less_than = (
-                    get_model_str(left_src_idx).lower()
-                    < get_model_str(right_src_idx).lower()
+                    value_to_str(left_src_item.text()).lower()
+                    < value_to_str(right_src_item.text()).lower()
                 )
                 if self.sortOrder() == QtCore.Qt.AscendingOrder:
                     return is_less_than
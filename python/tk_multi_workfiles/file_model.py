@@ -76,6 +76,7 @@ class FileModel(QtGui.QStandardItemModel):
     WORK_AREA_ROLE = _BASE_ROLE + 3  # WorkArea data
     SEARCH_STATUS_ROLE = _BASE_ROLE + 4  # search status data
     SEARCH_MSG_ROLE = _BASE_ROLE + 5  # search message data
+    ITEM_PTR_ROLE = _BASE_ROLE + 6  # the model item itself
 
     class _BaseModelItem(QtGui.QStandardItem):
         """
@@ -99,6 +100,11 @@ class FileModel(QtGui.QStandardItemModel):
             """
             if role == FileModel.NODE_TYPE_ROLE:
                 return self._type
+            elif role == FileModel.ITEM_PTR_ROLE:
+                # return the item itself.  This allows code working with proxy
+                # model indexes to get to the item in a single data() call
+                # without having to map the index back to the source model:
+                return self
             else:
                 # just return the default implementation:
                 return QtGui.QStandardItem.data(self, role)
@@ -110,7 +116,7 @@ class FileModel(QtGui.QStandardItemModel):
             :param value:   The value to set the data with
             :param role:    The role to set the data for
             """
-            if role == FileModel.NODE_TYPE_ROLE:
+            if role in (FileModel.NODE_TYPE_ROLE, FileModel.ITEM_PTR_ROLE):
                 # do nothing as the data can't be set:
                 pass
             else:
@@ -304,6 +310,10 @@ class FileModel(QtGui.QStandardItemModel):
     uses_user_sandboxes = QtCore.Signal(object)  # Work area that uses sandboxes.
     # Signal emitted when the sandbox_users_found when users were found in the sandbox.
     sandbox_users_found = QtCore.Signal(list)  # list of users
+    # Signal emitted when the model starts searching for files
+    searches_started = QtCore.Signal()
+    # Signal emitted when all in-progress searches have completed or been stopped
+    searches_finished = QtCore.Signal()
 
     def __init__(self, bg_task_manager, parent):
         """
@@ -585,6 +595,8 @@ class FileModel(QtGui.QStandardItemModel):
             # nothing to do!
             return
 
+        had_in_progress_searches = bool(self._in_progress_searches)
+
         # get existing groups:
         group_map = {}
         for group_item in self._group_items():
@@ -612,6 +624,10 @@ class FileModel(QtGui.QStandardItemModel):
             self._in_progress_searches[search_id] = search
             self._app.log_debug("File Model: Started search %d..." % search_id)
 
+        if self._in_progress_searches and not had_in_progress_searches:
+            # the model has moved from idle to loading:
+            self.searches_started.emit()
+
     def _stop_in_progress_searches(self):
         """
         Stop all in-progress searches
@@ -626,6 +642,10 @@ class FileModel(QtGui.QStandardItemModel):
             self._sg_data_retriever.stop_work(request_id)
         self._pending_thumbnail_requests = {}
 
+        if search_ids:
+            # the model is no longer loading anything:
+            self.searches_finished.emit()
+
     def _update_groups(self):
         """
         Update groups in the model.  Remove any that are no longer needed and insert any that are
@@ -1186,6 +1206,10 @@ class FileModel(QtGui.QStandardItemModel):
         search = self._in_progress_searches[search_id]
         del self._in_progress_searches[search_id]
 
+        if not self._in_progress_searches:
+            # that was the last in-progress search:
+            self.searches_finished.emit()
+
         group_map = {}
         for group_item in self._group_items():
             group_map[group_item.key] = group_item
@@ -128,6 +128,21 @@ def get_model_data(item_or_index, role=QtCore.Qt.DisplayRole):
     return data
 
 
+def get_model_data_multi(item_or_index, roles):
+    """
+    Safely get the Qt model data for several roles on the specified item or index in
+    one go.  This is useful on hot paths (e.g. selection handling) where fetching
+    multiple roles individually would repeatedly dispatch through the model's data()
+    method.
+
+    :param item_or_index:   The QStandardModelItem or QModelIndex to retrieve data for
+    :param roles:           A list of Qt data roles to return data for
+    :returns:               A tuple containing the data for each of the specified
+                            roles, in the same order as the roles
+    """
+    return tuple(get_model_data(item_or_index, role) for role in roles)
+
+
 def get_model_str(item_or_index, role=QtCore.Qt.DisplayRole):
     """
     Safely get the Qt model data as a Python string for the specified item or index.  This
@@ -317,6 +317,55 @@ class TestFileModelWithSandboxes(TestFileModelBase):
             ]
         )
 
+    @pytest.mark.skipif(
+        sys.version_info.major == 2 and sgtk.util.is_windows() and "CI" in os.environ,
+        reason="This test is flaky on Windows, Python 2.7.",
+    )
+    def test_searches_started_and_finished_emitted_once_per_load(self):
+        """
+        Ensure the model emits exactly one searches_started/searches_finished
+        pair for each load cycle, including when an in-progress load is
+        stopped by a new set of searches.
+        """
+        self.create_work_file(self._concept_ctx_jeff, "scene", 1)
+
+        started = []
+        finished = []
+        self._model.searches_started.connect(lambda: started.append(None))
+        self._model.searches_finished.connect(lambda: finished.append(None))
+
+        # an initial load should emit a single started/finished pair even
+        # though it runs more than one search:
+        with self._wait_for_groups(2):
+            self._model.set_entity_searches(
+                [
+                    self.FileModel.SearchDetails("Concept files", self._task_concept),
+                    self.FileModel.SearchDetails("Rig files", self._task_rig),
+                ]
+            )
+
+        assert len(started) == 1
+        assert len(finished) == 1
+
+        # a refresh is a new load cycle so should emit another pair:
+        with self._wait_for_groups(2):
+            self._model.async_refresh()
+
+        assert len(started) == 2
+        assert len(finished) == 2
+
+        # setting new searches whilst a load is still in progress should
+        # finish the current cycle (by stopping its searches) and start a
+        # new one:
+        self._model.async_refresh()
+        with self._wait_for_groups(1):
+            self._model.set_entity_searches(
+                [self.FileModel.SearchDetails("Concept files", self._task_concept)]
+            )
+
+        assert len(started) == 4
+        assert len(finished) == 4
+
 
 class TestFileModelWithTaskFolder(TestFileModelBase):
     """